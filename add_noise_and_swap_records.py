@@ -5,12 +5,18 @@ ignoring the last two columns (encoding + uid), then swap encodings between
 records. Expects files like fakename_50k_bf_encoded.tsv etc. in --input-dir.
 """
 import argparse
-import csv
 import pathlib
-import random
+import queue
 import re
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Iterable, List, Sequence
+from functools import lru_cache
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, TextIO, Tuple
+
+import numpy as np
 
 def clamp(prob: float, maximum: float = 0.95) -> float:
     return max(0.0, min(prob, maximum))
@@ -31,124 +37,264 @@ def build_noise_config(level: float) -> Dict[str, float]:
         "max_date_shift_days": max(1, int(12 * level)),
     }
 
-def introduce_typo(value: str, rng: random.Random) -> str:
+_TYPO_OPS = ("delete", "insert", "swap", "replace")
+_LETTERS = "abcdefghijklmnopqrstuvwxyz"
+_CASE_FNS = (str.lower, str.upper, str.title, str.capitalize)
+_NAME_SUFFIXES = (" Jr", " Sr", " II", " III", "-Smith")
+
+# The character mutators are deterministic: every random choice arrives as a
+# pre-drawn uniform in [0, 1) so a whole column's draws come from one Generator call.
+def introduce_typo(value: str, u_idx: float, u_op: float, u_letter: float) -> str:
     if not value:
         return value
-    idx = rng.randrange(len(value))
-    operations = ("delete", "insert", "swap", "replace")
-    op = rng.choice(operations)
-    letters = "abcdefghijklmnopqrstuvwxyz"
+    idx = int(u_idx * len(value))
+    op = _TYPO_OPS[int(u_op * len(_TYPO_OPS))]
+    letter = _LETTERS[int(u_letter * len(_LETTERS))]
     if op == "delete":
         return value[:idx] + value[idx + 1 :]
     if op == "insert":
-        return value[:idx] + rng.choice(letters) + value[idx:]
+        return value[:idx] + letter + value[idx:]
     if op == "swap" and len(value) > 1:
         j = min(idx + 1, len(value) - 1)
         swapped = list(value)
         swapped[idx], swapped[j] = swapped[j], swapped[idx]
         return "".join(swapped)
-    return value[:idx] + rng.choice(letters) + value[idx + 1 :]
+    return value[:idx] + letter + value[idx + 1 :]
 
-def random_case(value: str, rng: random.Random) -> str:
+def random_case(value: str, u_fn: float) -> str:
     if not value:
         return value
-    fn = rng.choice([str.lower, str.upper, str.title, str.capitalize])
-    return fn(value)
+    return _CASE_FNS[int(u_fn * len(_CASE_FNS))](value)
 
-def add_whitespace(value: str, rng: random.Random) -> str:
+def add_whitespace(value: str, u_prefix: float, u_suffix: float) -> str:
     if not value:
         return value
-    prefix = " " * rng.randint(0, 2)
-    suffix = " " * rng.randint(0, 2)
+    prefix = " " * int(u_prefix * 3)
+    suffix = " " * int(u_suffix * 3)
     return f"{prefix}{value}{suffix}"
 
-def add_suffix(value: str, rng: random.Random) -> str:
+def add_suffix(value: str, u_suffix: float) -> str:
     if not value:
         return value
-    suffixes = [" Jr", " Sr", " II", " III", "-Smith"]
-    return value + rng.choice(suffixes)
+    return value + _NAME_SUFFIXES[int(u_suffix * len(_NAME_SUFFIXES))]
 
-def swap_two_characters(value: str, rng: random.Random) -> str:
+def swap_two_characters(value: str, u_i: float, u_j: float) -> str:
     if not value or len(value) < 2:
         return value
-    i, j = rng.sample(range(len(value)), 2)
-    if i == j:
-        return value
+    # Two distinct positions: j is drawn from the remaining len - 1 slots.
+    i = int(u_i * len(value))
+    j = int(u_j * (len(value) - 1))
+    if j >= i:
+        j += 1
     chars = list(value)
     chars[i], chars[j] = chars[j], chars[i]
     return "".join(chars)
 
-def parse_birthday(value: str):
-    formats = ["%m/%d/%Y", "%d/%m/%Y", "%Y-%m-%d"]
-    for fmt in formats:
-        try:
-            return datetime.strptime(value, fmt)
-        except ValueError:
-            continue
+def _date_field(part: str, is_day: bool = False) -> Optional[int]:
+    # Mirrors strptime's patterns: %m only takes ASCII digits, while %d also takes a
+    # space-padded day (" 7") and any Unicode digit after a leading 1 or 2 ("[12]\d").
+    if is_day and len(part) == 2:
+        if part[0] == " ":
+            part = part[1:]
+        elif part[0] in "12" and part[1].isdecimal():
+            return int(part)
+    if not (1 <= len(part) <= 2 and part.isascii() and part.isdigit()):
+        return None
+    return int(part)
+
+def _build_date(year: str, month: str, day: str) -> Optional[datetime]:
+    m = _date_field(month)
+    d = _date_field(day, is_day=True)
+    # %Y is four Unicode digits (\d\d\d\d), which is exactly str.isdecimal().
+    if len(year) != 4 or not year.isdecimal() or m is None or d is None:
+        return None
+    try:
+        return datetime(int(year), m, d)
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=None)
+def parse_birthday(value: str) -> Optional[datetime]:
+    # Same result as trying strptime with %m/%d/%Y, %d/%m/%Y, %Y-%m-%d in that order.
+    parts = value.split("/")
+    if len(parts) == 3:
+        return _build_date(parts[2], parts[0], parts[1]) or _build_date(parts[2], parts[1], parts[0])
+    parts = value.split("-")
+    if len(parts) == 3:
+        return _build_date(parts[0], parts[1], parts[2])
     return None
 
-def format_birthday(dt: datetime, rng: random.Random, config: Dict[str, float]) -> str:
-    if rng.random() < config["date_text_token_prob"]:
-        return rng.choice(["unknown", "n/a", "see notes", "??"])
-    if rng.random() < config["date_shift_prob"]:
-        delta = rng.randint(-config["max_date_shift_days"], config["max_date_shift_days"])
-        dt = dt + timedelta(days=delta)
-    formats = ["%m/%d/%Y", "%d/%m/%Y", "%Y-%m-%d", "%m-%d-%Y", "%d %b %Y"]
-    formatted = dt.strftime(rng.choice(formats))
-    if rng.random() < config["date_format_prob"]:
-        formatted = re.sub(r"\b0(\d)", r"\1", formatted)
-        if rng.random() < 0.3:
+_MONTH_ABBRS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+# Same output as dt.strftime(key) in the C locale, except that years below 1000 are
+# zero-padded to four digits (glibc's %Y does not pad them).
+_DATE_FORMATTERS: Dict[str, Callable[[datetime], str]] = {
+    "%m/%d/%Y": lambda dt: f"{dt.month:02d}/{dt.day:02d}/{dt.year:04d}",
+    "%d/%m/%Y": lambda dt: f"{dt.day:02d}/{dt.month:02d}/{dt.year:04d}",
+    "%Y-%m-%d": lambda dt: f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}",
+    "%m-%d-%Y": lambda dt: f"{dt.month:02d}-{dt.day:02d}-{dt.year:04d}",
+    "%d %b %Y": lambda dt: f"{dt.day:02d} {_MONTH_ABBRS[dt.month - 1]} {dt.year:04d}",
+}
+_OUTPUT_DATE_FORMATS = tuple(_DATE_FORMATTERS)
+_DATE_TEXT_TOKENS = ("unknown", "n/a", "see notes", "??")
+_LEADING_ZERO_RE = re.compile(r"\b0(\d)")
+
+def format_birthday(dt: datetime, shift_days: int, fmt: str, strip_zeros: bool, dashes: bool) -> str:
+    if shift_days:
+        dt = dt + timedelta(days=shift_days)
+    formatted = _DATE_FORMATTERS[fmt](dt)
+    if strip_zeros:
+        formatted = _LEADING_ZERO_RE.sub(r"\1", formatted)
+        if dashes:
             formatted = formatted.replace("/", "-")
     return formatted
 
-def mutate_name(value: str, rng: random.Random, config: Dict[str, float]) -> str:
-    if rng.random() < config["missing_prob"]:
-        return ""
-    if rng.random() < config["char_swap_prob"]:
-        value = swap_two_characters(value, rng)
-    if rng.random() < config["typo_prob"]:
-        value = introduce_typo(value, rng)
-    if rng.random() < config["case_prob"]:
-        value = random_case(value, rng)
-    if rng.random() < config["whitespace_prob"]:
-        value = add_whitespace(value, rng)
-    if rng.random() < config["suffix_prob"]:
-        value = add_suffix(value, rng)
-    return value
-
-def mutate_generic(value: str, rng: random.Random, config: Dict[str, float]) -> str:
-    if rng.random() < config["missing_prob"]:
-        return ""
-    if rng.random() < config["char_swap_prob"]:
-        value = swap_two_characters(value, rng)
-    if rng.random() < config["typo_prob"]:
-        value = introduce_typo(value, rng)
-    if rng.random() < config["case_prob"]:
-        value = random_case(value, rng)
-    if rng.random() < config["whitespace_prob"]:
-        value = add_whitespace(value, rng)
-    return value
-
-def mutate_encoded_row(row: Dict[str, str], fieldnames: Sequence[str], rng: random.Random, config: Dict[str, float]) -> Dict[str, str]:
+def _mutate_strings(
+    values: np.ndarray,
+    steps: Sequence[Tuple[float, Callable[..., str], int]],
+    rng_np: np.random.Generator,
+    config: Dict[str, float],
+) -> np.ndarray:
+    # Gates with probability 0 are dropped up front so they cost neither draws nor mask passes.
+    steps = [step for step in steps if step[0] > 0.0]
+    p_missing = config["missing_prob"]
+    if not steps and p_missing <= 0.0:
+        return values
+    # All active gate uniforms for the column come from a single draw (the missing gate
+    # first, when active); each mutator only runs on its masked rows, with its own choices
+    # drawn in one call.
+    n = len(values)
+    values = values.copy()
+    probs = np.array(([p_missing] if p_missing > 0.0 else []) + [prob for prob, _, _ in steps])
+    gates = rng_np.random((len(probs), n)) < probs[:, None]
+    if p_missing > 0.0:
+        missing, gates = gates[0], gates[1:]
+    else:
+        missing = np.zeros(n, dtype=bool)
+    draw = rng_np.random
+    for (_, fn, n_draws), gate in zip(steps, gates):
+        rows = np.flatnonzero(gate & ~missing).tolist()
+        for i, u in zip(rows, draw((len(rows), n_draws)).tolist()):
+            values[i] = fn(values[i], *u)
+    values[missing] = ""
+    return values
+
+def mutate_name(values: np.ndarray, rng_np: np.random.Generator, config: Dict[str, float]) -> np.ndarray:
+    steps = (
+        (config["char_swap_prob"], swap_two_characters, 2),
+        (config["typo_prob"], introduce_typo, 3),
+        (config["case_prob"], random_case, 1),
+        (config["whitespace_prob"], add_whitespace, 2),
+        (config["suffix_prob"], add_suffix, 1),
+    )
+    return _mutate_strings(values, steps, rng_np, config)
+
+def mutate_generic(values: np.ndarray, rng_np: np.random.Generator, config: Dict[str, float]) -> np.ndarray:
+    steps = (
+        (config["char_swap_prob"], swap_two_characters, 2),
+        (config["typo_prob"], introduce_typo, 3),
+        (config["case_prob"], random_case, 1),
+        (config["whitespace_prob"], add_whitespace, 2),
+    )
+    return _mutate_strings(values, steps, rng_np, config)
+
+def _scaled_choice(u: np.ndarray, k: int) -> np.ndarray:
+    # Map uniforms in [0, 1) to indices in [0, k); the clip guards against u / p rounding up to 1.0.
+    return np.minimum((u * k).astype(np.int64), k - 1)
+
+def mutate_date(values: np.ndarray, rng_np: np.random.Generator, config: Dict[str, float]) -> np.ndarray:
+    n = len(values)
+    parsed = [parse_birthday(v) for v in values]
+    valid = np.fromiter((dt is not None for dt in parsed), dtype=bool, count=n)
+
+    # Decisions that are nested or mutually exclusive share one uniform through cumulative
+    # thresholds; a draw below its threshold, rescaled to [0, 1), then picks the value.
+    p_token = config["date_text_token_prob"]
+    p_missing = config["missing_prob"]
+    p_shift = config["date_shift_prob"]
+    p_format = config["date_format_prob"]
+    # Only decisions with a positive threshold get a draw; a row of ones never passes one.
+    active = [max(p_token, p_missing) > 0.0, p_shift > 0.0, p_format > 0.0]
+    draws = iter(rng_np.random((sum(active) + 1, n)))
+    never = np.ones(n)
+    u_event, u_shift, u_format = (next(draws) if on else never for on in active)
+    u_fmt = next(draws)
+
+    # Text tokens only replace parseable dates and blanking only hits unparseable ones.
+    text_token = valid & (u_event < p_token)
+    missing = ~valid & (u_event < p_missing)
+    token_idx = _scaled_choice(u_event[text_token] / p_token, len(_DATE_TEXT_TOKENS))
+
+    max_shift = config["max_date_shift_days"]
+    shift = u_shift < p_shift
+    shift_days = np.zeros(n, dtype=np.int64)
+    shift_days[shift] = _scaled_choice(u_shift[shift] / p_shift, 2 * max_shift + 1) - max_shift
+
+    # Dashes go to 30% of the zero-stripped dates.
+    strip_zeros = u_format < p_format
+    dashes = u_format < 0.3 * p_format
+    fmt_idx = _scaled_choice(u_fmt, len(_OUTPUT_DATE_FORMATS))
+
+    out = values.copy()
+    # Plain lists and local bindings keep numpy scalar boxing and global lookups out of the row loop.
+    fmt = format_birthday
+    formats = _OUTPUT_DATE_FORMATS
+    rows = np.flatnonzero(valid & ~text_token).tolist()
+    for i, days, f, strip, dash in zip(
+        rows,
+        shift_days[rows].tolist(),
+        fmt_idx[rows].tolist(),
+        strip_zeros[rows].tolist(),
+        dashes[rows].tolist(),
+    ):
+        out[i] = fmt(parsed[i], days, formats[f], strip, dash)
+    out[text_token] = np.array(_DATE_TEXT_TOKENS, dtype=object)[token_idx]
+    out[missing] = ""
+    return out
+
+def classify_columns(fieldnames: Sequence[str]) -> List[Tuple[int, str]]:
+    # Decided once per header; build_block_mutator turns the result into code.
     # Skip the last two columns (encoding + uid)
     mutate_fields = fieldnames[:-2] if len(fieldnames) >= 2 else []
-    mutated = dict(row)
-    for col in mutate_fields:
-        val = row.get(col, "")
+    col_kinds = []
+    for idx, col in enumerate(mutate_fields):
         col_lower = col.lower()
         if col in ("GivenName", "Surname"):
-            mutated[col] = mutate_name(val, rng, config)
+            col_kinds.append((idx, "name"))
         elif "birth" in col_lower or "date" in col_lower:
-            dt = parse_birthday(val)
-            if dt:
-                mutated[col] = format_birthday(dt, rng, config)
-            elif rng.random() < config["missing_prob"]:
-                mutated[col] = ""
+            col_kinds.append((idx, "date"))
         else:
-            mutated[col] = mutate_generic(val, rng, config)
-    if rng.random() < config["swap_name_prob"] and "GivenName" in mutated and "Surname" in mutated:
-        mutated["GivenName"], mutated["Surname"] = mutated["Surname"], mutated["GivenName"]
-    return mutated
+            col_kinds.append((idx, "generic"))
+    return col_kinds
+
+def name_swap_columns(fieldnames: Sequence[str]) -> Optional[Tuple[int, int]]:
+    if "GivenName" in fieldnames and "Surname" in fieldnames:
+        return fieldnames.index("GivenName"), fieldnames.index("Surname")
+    return None
+
+_COLUMN_MUTATORS: Dict[str, Callable[[np.ndarray, np.random.Generator, Dict[str, float]], np.ndarray]] = {
+    "name": mutate_name,
+    "date": mutate_date,
+    "generic": mutate_generic,
+}
+
+@lru_cache(maxsize=None)
+def build_block_mutator(fieldnames: Tuple[str, ...]) -> Callable[[np.ndarray, np.random.Generator, Dict[str, float]], None]:
+    # Emits a straight-line function for this header, so the chunk loop runs no per-column
+    # dispatch at all. The returned function mutates a (rows x columns) object array in place.
+    lines = ["def mutate_block(block, rng_np, config):"]
+    for idx, kind in classify_columns(fieldnames):
+        lines.append(f"    block[:, {idx}] = {_COLUMN_MUTATORS[kind].__name__}(block[:, {idx}], rng_np, config)")
+    name_pair = name_swap_columns(fieldnames)
+    if name_pair is not None:
+        given_idx, surname_idx = name_pair
+        lines.append('    if config["swap_name_prob"] > 0.0:')
+        lines.append('        m = rng_np.random(len(block)) < config["swap_name_prob"]')
+        lines.append(f"        block[m, {given_idx}], block[m, {surname_idx}] = block[m, {surname_idx}], block[m, {given_idx}]")
+    if len(lines) == 1:
+        lines.append("    pass")
+    namespace = {fn.__name__: fn for fn in _COLUMN_MUTATORS.values()}
+    exec(compile("\n".join(lines), f"<block mutator {fieldnames!r}>", "exec"), namespace)
+    return namespace["mutate_block"]
 
 # --- Swap helpers (from swap_encoded_rows.py) ---
 def iter_encoded_files(input_dir: pathlib.Path) -> Iterable[pathlib.Path]:
@@ -162,40 +308,129 @@ def iter_encoded_files(input_dir: pathlib.Path) -> Iterable[pathlib.Path]:
         for path in sorted(input_dir.glob(pattern)):
             yield path
 
-def apply_encoding_swaps(rows: List[Dict[str, str]], enc_col: str, rng: random.Random, swap_prob: float) -> None:
-    if not rows or enc_col not in rows[0] or swap_prob <= 0.0:
+def apply_encoding_swaps(encodings: np.ndarray, rng_np: np.random.Generator, swap_prob: float) -> None:
+    n = len(encodings)
+    if n < 2 or swap_prob <= 0.0:
         return
-    indices = list(range(len(rows)))
-    rng.shuffle(indices)
-    for k in range(0, len(indices) - 1, 2):
-        if rng.random() >= swap_prob:
-            continue
-        i, j = indices[k], indices[k + 1]
-        rows[i][enc_col], rows[j][enc_col] = rows[j][enc_col], rows[i][enc_col]
+    # Pair rows up through a random permutation and swap each pair with probability swap_prob.
+    pairs = rng_np.permutation(n)[: n - n % 2].reshape(-1, 2)
+    pairs = pairs[rng_np.random(len(pairs)) < swap_prob]
+    left, right = pairs[:, 0], pairs[:, 1]
+    encodings[left], encodings[right] = encodings[right], encodings[left]
 
 # --- Pipeline ---
-def process_encoded_file(path: pathlib.Path, output_dir: pathlib.Path, rng: random.Random, config: Dict[str, float], swap_prob: float) -> pathlib.Path:
+CHUNK_ROWS = 10_000
+WRITE_QUEUE_SIZE = 4
+
+def split_tsv_lines(lines: Iterable[str]) -> List[List[str]]:
+    # One comprehension for the whole batch: a function call per line is measurable here.
+    return [line.rstrip("\n").split("\t") for line in lines]
+
+def fit_row(row: List[str], n_cols: int) -> List[str]:
+    if len(row) > n_cols:
+        raise ValueError(f"Row has {len(row)} fields but the header has {n_cols}: {row!r}")
+    return row + [""] * (n_cols - len(row))
+
+def iter_tsv_blocks(src: TextIO, n_cols: int) -> Iterator[np.ndarray]:
+    # Plain split is enough: the encoded TSVs carry no quoted fields or embedded tabs.
+    while True:
+        lines = list(islice(src, CHUNK_ROWS))
+        if not lines:
+            return
+        rows = split_tsv_lines(line for line in lines if line != "\n")
+        if any(len(row) != n_cols for row in rows):
+            rows = [fit_row(row, n_cols) for row in rows]
+        block = np.empty((len(rows), n_cols), dtype=object)
+        if rows:
+            block[:] = rows
+        yield block
+
+def write_batches(dst: TextIO, batches: "queue.Queue[Optional[str]]", errors: List[BaseException]) -> None:
+    # Runs until the None sentinel. After a failed write it keeps draining so the
+    # producer never blocks on a full queue; the error is re-raised by the producer.
+    while True:
+        batch = batches.get()
+        if batch is None:
+            return
+        if errors:
+            continue
+        try:
+            dst.write(batch)
+        except BaseException as exc:
+            errors.append(exc)
+
+def process_encoded_file(
+    path: pathlib.Path,
+    output_dir: pathlib.Path,
+    rng_np: np.random.Generator,
+    config: Dict[str, float],
+    swap_prob: float,
+) -> pathlib.Path:
     output_dir.mkdir(parents=True, exist_ok=True)
-    with path.open(newline="") as src:
-        reader = csv.DictReader(src, delimiter="\t")
-        rows: List[Dict[str, str]] = list(reader)
-        fieldnames = reader.fieldnames or (list(rows[0].keys()) if rows else [])
-    if not fieldnames:
-        return path
-
-    # Add noise (skip encoding + uid), then swap encodings.
-    noisy_rows = [mutate_encoded_row(row, fieldnames, rng, config) for row in rows]
-    enc_col = fieldnames[-2] if len(fieldnames) >= 2 else None
-    if enc_col:
-        apply_encoding_swaps(noisy_rows, enc_col, rng, swap_prob)
+    with path.open() as src:
+        header_line = src.readline()
+        if not header_line:
+            return path
+        fieldnames = split_tsv_lines([header_line])[0]
+        n_cols = len(fieldnames)
+        enc_idx = n_cols - 2
+
+        # Only the encoding column is buffered for the swap; everything else streams chunk by chunk.
+        encodings: Optional[np.ndarray] = None
+        if enc_idx >= 0 and swap_prob > 0.0:
+            encodings = np.array(
+                [enc for block in iter_tsv_blocks(src, n_cols) for enc in block[:, enc_idx].tolist()], dtype=object
+            )
+            apply_encoding_swaps(encodings, rng_np, swap_prob)
+    mutate_block = build_block_mutator(tuple(fieldnames))
 
     output_path = output_dir / f"{path.stem}.tsv"
-    with output_path.open("w", newline="") as dst:
-        writer = csv.DictWriter(dst, fieldnames=fieldnames, delimiter="\t")
-        writer.writeheader()
-        writer.writerows(noisy_rows)
+    # Written under a temporary name and renamed at the end, so a failure part-way
+    # (malformed row, write error) never leaves a truncated output file behind.
+    tmp_path = output_path.with_name(output_path.name + ".tmp")
+    try:
+        with path.open() as src, tmp_path.open("w", newline="") as dst:
+            src.readline()
+            # A background thread writes finished chunks while the next one is mutated.
+            batches: "queue.Queue[Optional[str]]" = queue.Queue(maxsize=WRITE_QUEUE_SIZE)
+            errors: List[BaseException] = []
+            writer = threading.Thread(target=write_batches, args=(dst, batches, errors), daemon=True)
+            writer.start()
+            try:
+                # Lines end in "\n"; the original csv.DictWriter output used "\r\n".
+                # utils.read_tsv reads both.
+                batches.put("\t".join(fieldnames) + "\n")
+                start = 0
+                for block in iter_tsv_blocks(src, n_cols):
+                    if errors:
+                        break
+                    # Add noise (skip encoding + uid), then apply the swapped encodings.
+                    mutate_block(block, rng_np, config)
+                    if encodings is not None:
+                        block[:, enc_idx] = encodings[start : start + len(block)]
+                    batches.put("".join("\t".join(row) + "\n" for row in block.tolist()))
+                    start += len(block)
+            finally:
+                batches.put(None)
+                writer.join()
+            if errors:
+                raise errors[0]
+        tmp_path.replace(output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     return output_path
 
+def file_seed(seed: int, path: pathlib.Path) -> int:
+    # Derived from the file name (not Python's salted hash) so runs are reproducible
+    # regardless of worker scheduling.
+    return int(np.random.SeedSequence([seed, zlib.crc32(path.name.encode())]).generate_state(1)[0])
+
+def process_encoded_file_worker(
+    path: pathlib.Path, output_dir: pathlib.Path, config: Dict[str, float], swap_prob: float, seed: int
+) -> pathlib.Path:
+    return process_encoded_file(path, output_dir, np.random.default_rng(seed), config, swap_prob)
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Add noise to encoded TSVs (ignoring encoding+uid) and swap encodings between records."
@@ -205,9 +440,9 @@ def main() -> None:
     parser.add_argument("--noise-level", type=float, default=1.0, help="Scales noise aggressiveness.")
     parser.add_argument("--swap-prob", type=float, default=0.01, help="Probability per random pair of rows to swap encodings.")
     parser.add_argument("--seed", type=int, default=42, help="Random seed.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of worker processes (default: CPU count).")
     args = parser.parse_args()
 
-    rng = random.Random(args.seed)
     config = build_noise_config(args.noise_level)
 
     if not args.input_dir.exists():
@@ -218,13 +453,19 @@ def main() -> None:
         raise SystemExit(f"No encoded TSV files found under {args.input_dir}")
 
     print(f"Adding noise (skip last two cols) and swapping encodings for {len(files)} files -> {args.output_dir}")
-    for path in files:
-        out_path = process_encoded_file(path, args.output_dir, rng, config, args.swap_prob)
-        try:
-            pretty = out_path.relative_to(pathlib.Path.cwd())
-        except ValueError:
-            pretty = out_path
-        print(f"- {path.name} -> {pretty}")
+    # Files are independent; each worker seeds its RNGs from the file name.
+    seeds = [file_seed(args.seed, path) for path in files]
+    n = len(files)
+    with ProcessPoolExecutor(max_workers=args.workers) as ex:
+        out_paths = ex.map(
+            process_encoded_file_worker, files, [args.output_dir] * n, [config] * n, [args.swap_prob] * n, seeds
+        )
+        for path, out_path in zip(files, out_paths):
+            try:
+                pretty = out_path.relative_to(pathlib.Path.cwd())
+            except ValueError:
+                pretty = out_path
+            print(f"- {path.name} -> {pretty}")
 
 if __name__ == "__main__":
     main()
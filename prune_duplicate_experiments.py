@@ -14,42 +14,47 @@ import csv
 import json
 import math
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 
-def load_config(config_path: Path) -> Optional[dict]:
+def load_config(config_path: Path, log: Callable[[str], None] = print) -> Optional[dict]:
     """Load a JSON config file."""
     try:
         with config_path.open("r") as handle:
             return json.load(handle)
     except FileNotFoundError:
-        print(f"Skipping {config_path.parent.name}: config.json not found")
+        log(f"Skipping {config_path.parent.name}: config.json not found")
     except json.JSONDecodeError as exc:
-        print(f"Skipping {config_path.parent.name}: invalid JSON ({exc})")
+        log(f"Skipping {config_path.parent.name}: invalid JSON ({exc})")
     except OSError as exc:
-        print(f"Skipping {config_path.parent.name}: cannot read config ({exc})")
+        log(f"Skipping {config_path.parent.name}: cannot read config ({exc})")
     return None
 
 
-def read_avg_dice(metrics_path: Path) -> Optional[float]:
+def read_avg_dice(metrics_path: Path, log: Callable[[str], None] = print) -> Optional[float]:
     """Return avg_dice from trained_model/metrics.csv, if present."""
     if not metrics_path.exists():
         return None
 
     try:
         with metrics_path.open("r", newline="") as handle:
-            reader = csv.DictReader(handle)
+            reader = csv.reader(handle)
+            header = next(reader, None)
+            if header is None or "metric" not in header or "value" not in header:
+                return None
+            metric_idx = header.index("metric")
+            value_idx = header.index("value")
             for row in reader:
-                metric_name = (row.get("metric") or "").strip().lower()
-                if metric_name == "avg_dice":
-                    value = row.get("value")
-                    try:
-                        return float(value)
-                    except (TypeError, ValueError):
-                        return None
+                if len(row) <= metric_idx or row[metric_idx].strip().lower() != "avg_dice":
+                    continue
+                try:
+                    return float(row[value_idx])
+                except (IndexError, ValueError):
+                    return None
     except OSError as exc:
-        print(f"Could not read metrics at {metrics_path}: {exc}")
+        log(f"Could not read metrics at {metrics_path}: {exc}")
     return None
 
 
@@ -79,31 +84,47 @@ def build_key(config: dict) -> Optional[Tuple[str, str, float]]:
     return encoding, dataset, overlap
 
 
-def collect_runs(base_dir: Path) -> Dict[Tuple[str, str, float], List[dict]]:
-    """Collect experiment runs grouped by their deduplication key."""
-    grouped: Dict[Tuple[str, str, float], List[dict]] = {}
+def load_run(exp_dir: Path) -> Tuple[Optional[dict], List[str]]:
+    """Load config and metrics for a single experiment directory.
 
-    for exp_dir in sorted(base_dir.iterdir()):
-        if not exp_dir.is_dir():
-            continue
+    Messages are returned rather than printed so the caller can emit them in
+    directory order even though runs are loaded concurrently.
+    """
+    messages: List[str] = []
+    if not exp_dir.is_dir():
+        return None, messages
 
-        config = load_config(exp_dir / "config.json")
-        if config is None:
-            continue
+    config = load_config(exp_dir / "config.json", log=messages.append)
+    if config is None:
+        return None, messages
+
+    key = build_key(config)
+    if key is None:
+        messages.append(f"Skipping {exp_dir.name}: missing encoding/dataset/overlap in config")
+        return None, messages
+
+    avg_dice = read_avg_dice(exp_dir / "trained_model" / "metrics.csv", log=messages.append)
+    run_info = {
+        "path": exp_dir,
+        "avg_dice": avg_dice,
+        "key": key,
+    }
+    return run_info, messages
 
-        key = build_key(config)
-        if key is None:
-            print(f"Skipping {exp_dir.name}: missing encoding/dataset/overlap in config")
-            continue
 
-        avg_dice = read_avg_dice(exp_dir / "trained_model" / "metrics.csv")
-        run_info = {
-            "path": exp_dir,
-            "avg_dice": avg_dice,
-            "mtime": exp_dir.stat().st_mtime,
-            "key": key,
-        }
-        grouped.setdefault(key, []).append(run_info)
+def collect_runs(base_dir: Path, max_workers: int = 32) -> Dict[Tuple[str, str, float], List[dict]]:
+    """Collect experiment runs grouped by their deduplication key."""
+    grouped: Dict[Tuple[str, str, float], List[dict]] = {}
+
+    # Loading is I/O-bound, so threads overlap the file reads.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(load_run, sorted(base_dir.iterdir())))
+
+    for run_info, messages in results:
+        for message in messages:
+            print(message)
+        if run_info is not None:
+            grouped.setdefault(run_info["key"], []).append(run_info)
 
     return grouped
 
@@ -116,7 +137,10 @@ def choose_best_and_deletions(
     to_delete: List[dict] = []
 
     for key, runs in grouped.items():
-        valid_runs = [r for r in runs if r["avg_dice"] is not None]
+        # NaN dice (e.g. a diverged run) cannot be ranked, so treat it like a missing value.
+        valid_runs = [
+            r for r in runs if r["avg_dice"] is not None and not math.isnan(r["avg_dice"])
+        ]
         if not valid_runs:
             print(
                 f"No avg_dice found for combination {key}; not deleting any of "
@@ -124,11 +148,13 @@ def choose_best_and_deletions(
             )
             continue
 
-        def score(run: dict) -> Tuple[float, float]:
-            dice = run["avg_dice"]
-            return (dice if dice is not None else -math.inf, run["mtime"])
-
-        best = max(valid_runs, key=score)
+        best_dice = max(run["avg_dice"] for run in valid_runs)
+        candidates = [run for run in valid_runs if run["avg_dice"] == best_dice]
+        if len(candidates) > 1:
+            # Only runs tied on avg_dice need the mtime tiebreak, so stat just those.
+            best = max(candidates, key=lambda run: run["path"].stat().st_mtime)
+        else:
+            best = candidates[0]
         keepers[key] = best
 
         for run in runs:
@@ -160,6 +186,12 @@ def main() -> None:
         default=Path("experiment_results"),
         help="Root directory that contains experiment folders.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=32,
+        help="Number of threads used to read experiment folders.",
+    )
     parser.add_argument(
         "--delete",
         action="store_true",
@@ -171,7 +203,7 @@ def main() -> None:
     if not base_dir.exists() or not base_dir.is_dir():
         raise SystemExit(f"{base_dir} does not exist or is not a directory")
 
-    grouped = collect_runs(base_dir)
+    grouped = collect_runs(base_dir, max_workers=args.workers)
     keepers, to_delete = choose_best_and_deletions(grouped)
 
     total = sum(len(runs) for runs in grouped.values())
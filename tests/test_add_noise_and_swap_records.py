@@ -0,0 +1,102 @@
+import random
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+import add_noise_and_swap_records as noise
+
+
+def strptime_birthday(value):
+    for fmt in ("%m/%d/%Y", "%d/%m/%Y", "%Y-%m-%d"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+    return None
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "1/2/1990",
+        "01/02/1990",
+        "13/02/1990",
+        "02/30/1990",
+        " 1/2/1990",
+        "1/ 2/1990",
+        "1990-01-02",
+        "1990-13-01",
+        "1/2/90",
+        "１/02/1990",
+        "1396-9-١",
+        "1/1١/1990",
+        "1/2/１990",
+        "",
+    ],
+)
+def test_parse_birthday_matches_strptime(value):
+    assert noise.parse_birthday(value) == strptime_birthday(value)
+
+
+def test_parse_birthday_matches_strptime_on_random_strings():
+    rng = random.Random(0)
+    alphabet = "0123456789/- ١١٣"
+    for _ in range(20_000):
+        value = "".join(rng.choice(alphabet) for _ in range(rng.randint(6, 11)))
+        assert noise.parse_birthday(value) == strptime_birthday(value), value
+
+
+def write_encoded_tsv(path, n_rows, extra_row_at=None):
+    lines = ["GivenName\tSurname\tBirthday\tbloomfilter\tuid\n"]
+    for i in range(n_rows):
+        if i == extra_row_at:
+            lines.append("a\tb\tc\td\te\tf\n")
+        lines.append(f"Anna\tMeyer\t1/2/1990\t0101\t{i}\n")
+    path.write_text("".join(lines))
+
+
+def test_malformed_row_leaves_no_output(tmp_path):
+    src = tmp_path / "data_bf_encoded.tsv"
+    write_encoded_tsv(src, 100, extra_row_at=50)
+    out_dir = tmp_path / "out"
+
+    with pytest.raises(ValueError):
+        noise.process_encoded_file(src, out_dir, np.random.default_rng(0), noise.build_noise_config(1.0), 0.0)
+
+    assert list(out_dir.iterdir()) == []
+
+
+def test_write_error_stops_early_and_leaves_no_output(tmp_path, monkeypatch):
+    src = tmp_path / "data_bf_encoded.tsv"
+    write_encoded_tsv(src, 2_000)
+    out_dir = tmp_path / "out"
+    received = []
+
+    def failing_writer(dst, batches, errors):
+        while True:
+            batch = batches.get()
+            if batch is None:
+                return
+            received.append(batch)
+            errors.append(OSError("disk full"))
+
+    monkeypatch.setattr(noise, "CHUNK_ROWS", 10)
+    monkeypatch.setattr(noise, "write_batches", failing_writer)
+
+    with pytest.raises(OSError):
+        noise.process_encoded_file(src, out_dir, np.random.default_rng(0), noise.build_noise_config(1.0), 0.0)
+
+    assert len(received) < 10
+    assert list(out_dir.iterdir()) == []
+
+
+def test_zero_missing_prob_never_blanks_values():
+    config = noise.build_noise_config(1.0)
+    config["missing_prob"] = 0.0
+    values = np.array(["Anna"] * 2_000, dtype=object)
+
+    mutated = noise.mutate_name(values, np.random.default_rng(0), config)
+
+    assert not (mutated == "").any()
+    assert (mutated != "Anna").any()
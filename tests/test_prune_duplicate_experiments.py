@@ -0,0 +1,24 @@
+from pathlib import Path
+
+from prune_duplicate_experiments import choose_best_and_deletions
+
+
+def test_nan_avg_dice_is_not_kept(tmp_path: Path):
+    key = ("BloomFilter", "fakename_1k.tsv", 0.8)
+    nan_run = {"path": tmp_path / "a", "avg_dice": float("nan"), "key": key}
+    good_run = {"path": tmp_path / "b", "avg_dice": 0.5, "key": key}
+
+    keepers, to_delete = choose_best_and_deletions({key: [nan_run, good_run]})
+
+    assert keepers[key] is good_run
+    assert to_delete == [nan_run]
+
+
+def test_all_nan_avg_dice_deletes_nothing(tmp_path: Path):
+    key = ("BloomFilter", "fakename_1k.tsv", 0.8)
+    runs = [{"path": tmp_path / name, "avg_dice": float("nan"), "key": key} for name in "ab"]
+
+    keepers, to_delete = choose_best_and_deletions({key: runs})
+
+    assert keepers == {}
+    assert to_delete == []